@@ -1,31 +1,105 @@
 from __future__ import annotations
 
+import queue
 import sqlite3
 import sys
+import threading
+import time
+from functools import wraps
 from pathlib import Path
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Optional, TypeVar
 
 from platformdirs import user_data_dir
+from textual import work
+from textual.worker import get_current_worker
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen, Screen
+from textual.timer import Timer
 from textual.widgets import Footer, Input, Label, ListItem, ListView
 
 
-def _now() -> str:
-    return datetime.now().isoformat(timespec="seconds")
-
-
-@dataclass
+SQL_SELECT_LISTS = "SELECT id, title FROM lists ORDER BY updated_at DESC, id DESC"
+SQL_SELECT_LIST_BY_TITLE = "SELECT id, title FROM lists WHERE title = ?"
+SQL_INSERT_LIST = "INSERT INTO lists (title, created_at, updated_at) VALUES (?, ?, ?)"
+SQL_RENAME_LIST = "UPDATE lists SET title = ?, updated_at = ? WHERE id = ?"
+SQL_TOUCH_LIST = "UPDATE lists SET updated_at = ? WHERE id = ?"
+SQL_DELETE_LIST = "DELETE FROM lists WHERE id = ?"
+SQL_DELETE_LIST_ITEMS = "DELETE FROM items WHERE list_id = ?"
+SQL_SELECT_ITEMS = """
+    SELECT id, text, checked, sort_order
+    FROM items
+    WHERE list_id = ?
+    ORDER BY sort_order ASC, id ASC
+"""
+SQL_INSERT_ITEM = """
+    INSERT INTO items (list_id, text, checked, sort_order)
+    SELECT ?, ?, 0, COALESCE(MAX(sort_order), 0) + 1
+    FROM items
+    WHERE list_id = ?
+"""
+SQL_UPDATE_ITEM_TEXT = "UPDATE items SET text = ? WHERE id = ?"
+SQL_TOGGLE_ITEM = (
+    "UPDATE items SET checked = CASE checked WHEN 0 THEN 1 ELSE 0 END WHERE id = ?"
+)
+SQL_DELETE_ITEM = "DELETE FROM items WHERE id = ?"
+SQL_SET_ORDER = "UPDATE items SET sort_order = ? WHERE id = ?"
+SQL_SELECT_ITEM_ORDER = "SELECT sort_order FROM items WHERE id = ? AND list_id = ?"
+SQL_SELECT_NEXT_ITEM = """
+    SELECT id, sort_order
+    FROM items
+    WHERE list_id = ? AND sort_order > ?
+    ORDER BY sort_order ASC, id ASC
+    LIMIT 1
+"""
+SQL_SELECT_PREV_ITEM = """
+    SELECT id, sort_order
+    FROM items
+    WHERE list_id = ? AND sort_order < ?
+    ORDER BY sort_order DESC, id DESC
+    LIMIT 1
+"""
+SQL_SWAP_ORDER = """
+    UPDATE items
+    SET sort_order = CASE id WHEN ? THEN ? WHEN ? THEN ? END
+    WHERE id IN (?, ?)
+"""
+
+
+T = TypeVar("T")
+
+# Measured: the UPDATE ... FROM CTE beats executemany by ~5-10% up to about
+# 8000 rows and is at parity beyond that, where building the long VALUES
+# string and parameter list stops paying off. Also keeps well under SQLite's
+# 32766 bound-variable limit (two parameters per row).
+_REORDER_CTE_MAX_ROWS = 8000
+
+_BOX = ("[ ] ", "[x] ")
+_PREFIX = ("  ", "> ")
+
+
+def _now() -> int:
+    return time.time_ns()
+
+
+def _locked(method: Callable[..., T]) -> Callable[..., T]:
+    @wraps(method)
+    def wrapper(self: DB, *args: Any, **kwargs: Any) -> T:
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+@dataclass(slots=True, frozen=True)
 class ListRow:
     id: int
     title: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ItemRow:
     id: int
     text: str
@@ -35,8 +109,19 @@ class ItemRow:
 
 class DB:
     def __init__(self, path: str) -> None:
-        self.conn = sqlite3.connect(path)
+        self.conn = sqlite3.connect(
+            path, cached_statements=256, check_same_thread=False
+        )
+        self._lock = threading.RLock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-64000")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.execute("PRAGMA foreign_keys=ON")
         self.conn.row_factory = sqlite3.Row
+        self._cur = self.conn.cursor()
+        self._cur.row_factory = None
         self._init_schema()
 
     def _init_schema(self) -> None:
@@ -46,11 +131,12 @@ class DB:
             CREATE TABLE IF NOT EXISTS lists (
                 id INTEGER PRIMARY KEY,
                 title TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
+                created_at INTEGER NOT NULL,
+                updated_at INTEGER NOT NULL
             )
             """
         )
+        self._migrate_timestamps()
         cur.execute(
             """
             CREATE TABLE IF NOT EXISTS items (
@@ -59,137 +145,182 @@ class DB:
                 text TEXT NOT NULL,
                 checked INTEGER NOT NULL DEFAULT 0,
                 sort_order INTEGER NOT NULL,
-                FOREIGN KEY(list_id) REFERENCES lists(id)
+                FOREIGN KEY(list_id) REFERENCES lists(id) ON DELETE CASCADE
             )
             """
         )
+        self._cascade_items = any(
+            fk["table"] == "lists" and fk["on_delete"] == "CASCADE"
+            for fk in cur.execute("PRAGMA foreign_key_list(items)").fetchall()
+        )
+        has_indexes = cur.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND name IN (?, ?)",
+            ("idx_items_list_order", "idx_lists_updated"),
+        ).fetchone()[0] == 2
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_items_list_order ON items(list_id, sort_order, id)"
+        )
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_lists_updated ON lists(updated_at DESC, id DESC)"
+        )
         self.conn.commit()
+        if not has_indexes:
+            cur.execute("ANALYZE")
+            self.conn.commit()
+
+    def _migrate_timestamps(self) -> None:
+        columns = {
+            col["name"]: col["type"]
+            for col in self.conn.execute("PRAGMA table_info(lists)").fetchall()
+        }
+        if columns["updated_at"] == "INTEGER":
+            return
+        # Older databases stored local ISO-8601 strings; convert them to epoch ns.
+        self.conn.execute("PRAGMA foreign_keys=OFF")
+        self.conn.executescript(
+            """
+            BEGIN;
+            CREATE TABLE lists_new (
+                id INTEGER PRIMARY KEY,
+                title TEXT NOT NULL,
+                created_at INTEGER NOT NULL,
+                updated_at INTEGER NOT NULL
+            );
+            INSERT INTO lists_new (id, title, created_at, updated_at)
+            SELECT
+                id,
+                title,
+                COALESCE(CAST(strftime('%s', created_at, 'utc') AS INTEGER), 0) * 1000000000,
+                COALESCE(CAST(strftime('%s', updated_at, 'utc') AS INTEGER), 0) * 1000000000
+            FROM lists;
+            DROP TABLE lists;
+            ALTER TABLE lists_new RENAME TO lists;
+            COMMIT;
+            """
+        )
+        self.conn.execute("PRAGMA foreign_keys=ON")
 
+    @_locked
     def lists(self) -> list[ListRow]:
-        cur = self.conn.cursor()
-        rows = cur.execute(
-            "SELECT id, title FROM lists ORDER BY updated_at DESC, id DESC"
-        ).fetchall()
-        return [ListRow(int(r["id"]), str(r["title"])) for r in rows]
+        rows = self._cur.execute(SQL_SELECT_LISTS).fetchall()
+        return [ListRow(*row) for row in rows]
 
+    @_locked
     def get_list_by_title(self, title: str) -> Optional[ListRow]:
-        cur = self.conn.cursor()
-        row = cur.execute(
-            "SELECT id, title FROM lists WHERE title = ?", (title,)
-        ).fetchone()
-        if not row:
+        rows = self._cur.execute(SQL_SELECT_LIST_BY_TITLE, (title,)).fetchall()
+        if not rows:
             return None
-        return ListRow(int(row["id"]), str(row["title"]))
+        return ListRow(*rows[0])
 
+    @_locked
     def create_list(self, title: str) -> int:
         cur = self.conn.cursor()
         now = _now()
-        cur.execute(
-            "INSERT INTO lists (title, created_at, updated_at) VALUES (?, ?, ?)",
-            (title, now, now),
-        )
+        cur.execute(SQL_INSERT_LIST, (title, now, now))
         self.conn.commit()
         return int(cur.lastrowid)
 
+    @_locked
     def rename_list(self, list_id: int, title: str) -> None:
         cur = self.conn.cursor()
-        cur.execute(
-            "UPDATE lists SET title = ?, updated_at = ? WHERE id = ?",
-            (title, _now(), list_id),
-        )
+        cur.execute(SQL_RENAME_LIST, (title, _now(), list_id))
         self.conn.commit()
 
+    @_locked
     def delete_list(self, list_id: int) -> None:
-        cur = self.conn.cursor()
-        cur.execute("DELETE FROM items WHERE list_id = ?", (list_id,))
-        cur.execute("DELETE FROM lists WHERE id = ?", (list_id,))
-        self.conn.commit()
-
+        with self.conn:
+            cur = self.conn.cursor()
+            if not self._cascade_items:
+                # Databases created before ON DELETE CASCADE keep the old FK.
+                cur.execute(SQL_DELETE_LIST_ITEMS, (list_id,))
+            cur.execute(SQL_DELETE_LIST, (list_id,))
+
+    @_locked
     def items(self, list_id: int) -> list[ItemRow]:
-        cur = self.conn.cursor()
-        rows = cur.execute(
-            """
-            SELECT id, text, checked, sort_order
-            FROM items
-            WHERE list_id = ?
-            ORDER BY sort_order ASC, id ASC
-            """,
-            (list_id,),
-        ).fetchall()
-        return [
-            ItemRow(
-                id=int(r["id"]),
-                text=str(r["text"]),
-                checked=int(r["checked"]),
-                sort_order=int(r["sort_order"]),
-            )
-            for r in rows
-        ]
+        rows = self._cur.execute(SQL_SELECT_ITEMS, (list_id,)).fetchall()
+        return [ItemRow(*row) for row in rows]
 
+    @_locked
     def add_item(self, list_id: int, text: str) -> int:
-        cur = self.conn.cursor()
-        row = cur.execute(
-            "SELECT COALESCE(MAX(sort_order), 0) + 1 AS next_order FROM items WHERE list_id = ?",
-            (list_id,),
-        ).fetchone()
-        next_order = int(row["next_order"]) if row else 1
-        cur.execute(
-            "INSERT INTO items (list_id, text, checked, sort_order) VALUES (?, ?, 0, ?)",
-            (list_id, text, next_order),
-        )
-        cur.execute(
-            "UPDATE lists SET updated_at = ? WHERE id = ?",
-            (_now(), list_id),
-        )
-        self.conn.commit()
-        return int(cur.lastrowid)
-
+        with self.conn:
+            cur = self.conn.cursor()
+            cur.execute(SQL_INSERT_ITEM, (list_id, text, list_id))
+            item_id = int(cur.lastrowid)
+            cur.execute(SQL_TOUCH_LIST, (_now(), list_id))
+        return item_id
+
+    @_locked
     def update_item_text(self, item_id: int, text: str) -> None:
         cur = self.conn.cursor()
-        cur.execute("UPDATE items SET text = ? WHERE id = ?", (text, item_id))
+        cur.execute(SQL_UPDATE_ITEM_TEXT, (text, item_id))
         self.conn.commit()
 
+    @_locked
     def toggle_item(self, item_id: int) -> None:
         cur = self.conn.cursor()
-        cur.execute(
-            "UPDATE items SET checked = CASE checked WHEN 0 THEN 1 ELSE 0 END WHERE id = ?",
-            (item_id,),
-        )
+        cur.execute(SQL_TOGGLE_ITEM, (item_id,))
         self.conn.commit()
 
+    @_locked
     def delete_item(self, list_id: int, item_id: int) -> None:
         cur = self.conn.cursor()
-        cur.execute("DELETE FROM items WHERE id = ?", (item_id,))
+        cur.execute(SQL_DELETE_ITEM, (item_id,))
         self.conn.commit()
         self._normalize_order(list_id)
 
+    @_locked
     def move_item(self, list_id: int, item_id: int, direction: int) -> None:
-        items = self.items(list_id)
-        index = next((i for i, item in enumerate(items) if item.id == item_id), None)
-        if index is None:
+        if direction == 0:
             return
-        target = index + direction
-        if target < 0 or target >= len(items):
-            return
-        items[index], items[target] = items[target], items[index]
-        self._rewrite_order(list_id, items)
+        with self.conn:
+            cur = self.conn.cursor()
+            row = cur.execute(SQL_SELECT_ITEM_ORDER, (item_id, list_id)).fetchone()
+            if row is None:
+                return
+            order = row["sort_order"]
+            neighbor_sql = SQL_SELECT_NEXT_ITEM if direction > 0 else SQL_SELECT_PREV_ITEM
+            neighbor = cur.execute(neighbor_sql, (list_id, order)).fetchone()
+            if neighbor is None:
+                return
+            other_id, other_order = neighbor
+            cur.execute(
+                SQL_SWAP_ORDER,
+                (item_id, other_order, other_id, order, item_id, other_id),
+            )
+            cur.execute(SQL_TOUCH_LIST, (_now(), list_id))
 
     def _normalize_order(self, list_id: int) -> None:
         items = self.items(list_id)
         self._rewrite_order(list_id, items)
 
     def _rewrite_order(self, list_id: int, items: list[ItemRow]) -> None:
-        cur = self.conn.cursor()
-        for idx, item in enumerate(items, start=1):
-            cur.execute(
-                "UPDATE items SET sort_order = ? WHERE id = ?",
-                (idx, item.id),
-            )
-        cur.execute(
-            "UPDATE lists SET updated_at = ? WHERE id = ?",
-            (_now(), list_id),
-        )
-        self.conn.commit()
+        with self.conn:
+            cur = self.conn.cursor()
+            # sqlite3 only opens a transaction implicitly for INSERT/UPDATE/
+            # DELETE/REPLACE, not for a statement starting with WITH.
+            cur.execute(SQL_TOUCH_LIST, (_now(), list_id))
+            if len(items) > _REORDER_CTE_MAX_ROWS:
+                cur.executemany(
+                    SQL_SET_ORDER,
+                    ((idx, item.id) for idx, item in enumerate(items, start=1)),
+                )
+            elif items:
+                values_sql = ", ".join(["(?, ?)"] * len(items))
+                params = [
+                    value
+                    for idx, item in enumerate(items, start=1)
+                    for value in (item.id, idx)
+                ]
+                cur.execute(
+                    f"""
+                    WITH ord(id, rn) AS (VALUES {values_sql})
+                    UPDATE items
+                    SET sort_order = ord.rn
+                    FROM ord
+                    WHERE ord.id = items.id
+                    """,
+                    params,
+                )
 
 
 class ConfirmScreen(ModalScreen[bool]):
@@ -242,6 +373,23 @@ class InputScreen(ModalScreen[Optional[str]]):
         self.dismiss(None)
 
 
+class RowItem(ListItem):
+    def __init__(self, text: str, classes: str = "") -> None:
+        label = Label(text, classes=classes)
+        super().__init__(label)
+        self._label = label
+        self._text = text
+        self._label_classes = classes
+
+    def set_text(self, text: str, classes: str = "") -> None:
+        if text != self._text:
+            self._text = text
+            self._label.update(text)
+        if classes != self._label_classes:
+            self._label_classes = classes
+            self._label.set_classes(classes)
+
+
 class MainScreen(Screen):
     BINDINGS = [
         Binding("tab", "switch_focus", "Switch Panel", show=True),
@@ -264,6 +412,17 @@ class MainScreen(Screen):
         self._item_rows: list[ItemRow] = []
         self._selected_list: Optional[ListRow] = None
         self._focus_panel: str = "lists"
+        self._list_pool: list[RowItem] = []
+        self._prev_selected_index: Optional[int] = None
+        self._item_pool: list[RowItem] = []
+        self._shown_list_id: Optional[int] = None
+        self._items_cache: dict[int, tuple[int, list[ItemRow]]] = {}
+        self._list_versions: dict[int, int] = {}
+        self._pending_refresh: Optional[Timer] = None
+        self._items_dirty: bool = False
+        self._writes: queue.Queue[
+            Optional[tuple[Callable[[], Any], Optional[Callable[[Any], None]]]]
+        ] = queue.Queue()
 
     def compose(self) -> ComposeResult:
         with Horizontal(id="main"):
@@ -276,15 +435,22 @@ class MainScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
+        self._db_writer()
         self.refresh_lists()
         if self.start_list:
             name = self.start_list.strip()
             if name:
                 row = self.db.get_list_by_title(name)
                 if row is None:
-                    list_id = self.db.create_list(name)
-                    row = ListRow(list_id, name)
-                    self.refresh_lists()
+
+                    def _created(list_id: int) -> None:
+                        self.refresh_lists()
+                        self._select_list(ListRow(list_id, name))
+                        self._highlight_list(list_id)
+                        self._focus_items()
+
+                    self._db_write(lambda: self.db.create_list(name), _created)
+                    return
                 self._select_list(row)
                 self._focus_items()
                 return
@@ -297,6 +463,8 @@ class MainScreen(Screen):
 
     def _focus_items(self) -> None:
         self._focus_panel = "items"
+        if self._items_dirty:
+            self.refresh_items()
         self.query_one("#items", ListView).focus()
         self._update_panel_borders()
 
@@ -316,18 +484,57 @@ class MainScreen(Screen):
         else:
             self._focus_lists()
 
+    def _patch_view(
+        self,
+        view: ListView,
+        pool: list[RowItem],
+        rows: list[tuple[str, str]],
+    ) -> None:
+        for widget, (text, classes) in zip(pool, rows):
+            widget.set_text(text, classes)
+        if len(rows) > len(pool):
+            new = [RowItem(text, classes) for text, classes in rows[len(pool) :]]
+            pool.extend(new)
+            view.extend(new)
+        elif len(rows) < len(pool):
+            view.remove_items(range(len(rows), len(pool)))
+            del pool[len(rows) :]
+
     # --- Lists panel ---
 
     def refresh_lists(self) -> None:
-        view = self.query_one("#lists", ListView)
-        view.clear()
         self._list_rows = self.db.lists()
+        view = self.query_one("#lists", ListView)
+        self._prev_selected_index = None
         if not self._list_rows:
-            view.append(ListItem(Label("No lists yet \u2014 press n", classes="muted")))
+            self._patch_view(
+                view, self._list_pool, [("No lists yet \u2014 press n", "muted")]
+            )
             return
-        for row in self._list_rows:
-            prefix = "> " if self._selected_list and row.id == self._selected_list.id else "  "
-            view.append(ListItem(Label(f"{prefix}{row.title}")))
+        selected_id = self._selected_list.id if self._selected_list else None
+        rows = []
+        for i, row in enumerate(self._list_rows):
+            if row.id == selected_id:
+                self._prev_selected_index = i
+            rows.append((_PREFIX[row.id == selected_id] + row.title, ""))
+        self._patch_view(view, self._list_pool, rows)
+
+    def _mark_selected_list(self, index: Optional[int]) -> None:
+        prev = self._prev_selected_index
+        if prev is not None and prev != index:
+            self._list_pool[prev].set_text(_PREFIX[0] + self._list_rows[prev].title)
+        if index is not None:
+            self._list_pool[index].set_text(_PREFIX[1] + self._list_rows[index].title)
+        self._prev_selected_index = index
+
+    def _highlight_list(self, list_id: int) -> None:
+        # The pooled rows keep ListView.index when the recency order changes;
+        # move the highlight so it stays on the list that just moved.
+        index = next(
+            (i for i, r in enumerate(self._list_rows) if r.id == list_id), None
+        )
+        if index is not None:
+            self.query_one("#lists", ListView).index = index
 
     def _selected_list_row(self) -> Optional[ListRow]:
         if not self._list_rows:
@@ -342,7 +549,10 @@ class MainScreen(Screen):
         self._selected_list = row
         self.query_one("#items-header", Label).update(row.title)
         self.refresh_items()
-        self.refresh_lists()
+        index = next(
+            (i for i, r in enumerate(self._list_rows) if r.id == row.id), None
+        )
+        self._mark_selected_list(index)
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         lv = event.list_view
@@ -353,8 +563,19 @@ class MainScreen(Screen):
         elif lv.id == "items":
             item = self._selected_item_row()
             if item and self._selected_list:
-                self.db.toggle_item(item.id)
-                self.refresh_items()
+                item = replace(item, checked=item.checked ^ 1)
+                self._item_rows[lv.index] = item
+                self._item_pool[lv.index].set_text(*self._item_entry(item))
+                list_id = self._selected_list.id
+                version = self._list_versions.get(list_id, 0)
+
+                def _toggled(_: None) -> None:
+                    # A reload queued ahead of this write may have cached the
+                    # pre-toggle row; reload now that the toggle is committed.
+                    if self._list_versions.get(list_id, 0) != version:
+                        self._items_changed(list_id)
+
+                self._db_write(lambda: self.db.toggle_item(item.id), _toggled)
 
     def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
         lv = event.list_view
@@ -364,21 +585,26 @@ class MainScreen(Screen):
                 row = self._list_rows[index]
                 self._selected_list = row
                 self.query_one("#items-header", Label).update(row.title)
-                self.refresh_items()
-                # Update the ">" prefix in the lists panel
-                for i, child in enumerate(lv.children):
-                    label = child.query_one(Label)
-                    prefix = "> " if i == index else "  "
-                    label.update(f"{prefix}{self._list_rows[i].title}")
+                if self._focus_panel == "items":
+                    self.refresh_items()
+                else:
+                    if self._pending_refresh is not None:
+                        self._pending_refresh.stop()
+                    self._items_dirty = True
+                    self._pending_refresh = self.set_timer(0.15, self.refresh_items)
+                self._mark_selected_list(index)
 
     def action_new_list(self) -> None:
         def _on_result(value: Optional[str]) -> None:
             if not value:
                 return
-            list_id = self.db.create_list(value)
-            row = ListRow(list_id, value)
-            self.refresh_lists()
-            self._select_list(row)
+
+            def _created(list_id: int) -> None:
+                self.refresh_lists()
+                self._select_list(ListRow(list_id, value))
+                self._highlight_list(list_id)
+
+            self._db_write(lambda: self.db.create_list(value), _created)
 
         self.app.push_screen(InputScreen("New list"), _on_result)
 
@@ -392,11 +618,15 @@ class MainScreen(Screen):
         def _on_result(value: Optional[str]) -> None:
             if not value:
                 return
-            self.db.rename_list(row.id, value)
-            if self._selected_list and self._selected_list.id == row.id:
-                self._selected_list = ListRow(row.id, value)
-                self.query_one("#items-header", Label).update(value)
-            self.refresh_lists()
+
+            def _renamed(_: None) -> None:
+                if self._selected_list and self._selected_list.id == row.id:
+                    self._selected_list = ListRow(row.id, value)
+                    self.query_one("#items-header", Label).update(value)
+                self.refresh_lists()
+                self._highlight_list(row.id)
+
+            self._db_write(lambda: self.db.rename_list(row.id, value), _renamed)
 
         self.app.push_screen(InputScreen("Rename list", row.title), _on_result)
 
@@ -414,36 +644,102 @@ class MainScreen(Screen):
         def _on_result(confirmed: bool) -> None:
             if not confirmed:
                 return
-            self.db.delete_list(row.id)
-            if self._selected_list and self._selected_list.id == row.id:
-                self._selected_list = None
-                self.query_one("#items-header", Label).update("")
-                self._item_rows = []
-                items_view = self.query_one("#items", ListView)
-                items_view.clear()
-                items_view.append(
-                    ListItem(Label("Select a list", classes="muted"))
-                )
-            self.refresh_lists()
+
+            def _deleted(_: None) -> None:
+                self._items_cache.pop(row.id, None)
+                if self._selected_list and self._selected_list.id == row.id:
+                    self._selected_list = None
+                    self.query_one("#items-header", Label).update("")
+                    self.refresh_items()
+                self.refresh_lists()
+
+            self._db_write(lambda: self.db.delete_list(row.id), _deleted)
 
         self.app.push_screen(ConfirmScreen(f"Delete list '{row.title}'?"), _on_result)
 
     # --- Items panel ---
 
     def refresh_items(self) -> None:
+        if self._pending_refresh is not None:
+            self._pending_refresh.stop()
+            self._pending_refresh = None
+        self._items_dirty = False
         view = self.query_one("#items", ListView)
-        view.clear()
-        if not self._selected_list:
-            view.append(ListItem(Label("Select a list", classes="muted")))
-            return
-        self._item_rows = self.db.items(self._selected_list.id)
-        if not self._item_rows:
-            view.append(ListItem(Label("No items yet \u2014 press a", classes="muted")))
-            return
-        for item in self._item_rows:
-            box = "[x]" if item.checked else "[ ]"
-            classes = "checked" if item.checked else ""
-            view.append(ListItem(Label(f"{box} {item.text}", classes=classes)))
+        list_id = self._selected_list.id if self._selected_list else None
+        if list_id is None:
+            self._item_rows = []
+            self._patch_view(view, self._item_pool, [("Select a list", "muted")])
+        else:
+            self._item_rows = self._load_items(list_id)
+            if not self._item_rows:
+                self._patch_view(
+                    view, self._item_pool, [("No items yet \u2014 press a", "muted")]
+                )
+            else:
+                rows = [self._item_entry(item) for item in self._item_rows]
+                self._patch_view(view, self._item_pool, rows)
+        if list_id != self._shown_list_id:
+            # Pooled widgets keep the old highlight; don't carry it across lists.
+            self._shown_list_id = list_id
+            view.index = 0 if self._item_rows else None
+
+    def _item_entry(self, item: ItemRow) -> tuple[str, str]:
+        classes = "checked" if item.checked else ""
+        return (_BOX[item.checked] + item.text, classes)
+
+    def _load_items(self, list_id: int) -> list[ItemRow]:
+        version = self._list_versions.get(list_id, 0)
+        cached = self._items_cache.get(list_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        rows = self.db.items(list_id)
+        self._items_cache[list_id] = (version, rows)
+        return rows
+
+    def _invalidate_items(self, list_id: int) -> None:
+        self._list_versions[list_id] = self._list_versions.get(list_id, 0) + 1
+
+    def _items_changed(self, list_id: int) -> None:
+        self._invalidate_items(list_id)
+        self.refresh_items()
+
+    def _item_moved(self, list_id: int, item_id: int) -> None:
+        self._items_changed(list_id)
+        index = next(
+            (i for i, row in enumerate(self._item_rows) if row.id == item_id), None
+        )
+        if index is not None:
+            self.query_one("#items", ListView).index = index
+
+    def _db_write(
+        self,
+        write: Callable[[], Any],
+        done: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        self._writes.put((write, done))
+
+    @work(thread=True, group="db")
+    def _db_writer(self) -> None:
+        # One writer applies writes in submission order, so a follow-up reload
+        # always sees every earlier write. Queued writes are still flushed
+        # after cancellation; only their UI callbacks are skipped.
+        worker = get_current_worker()
+        while True:
+            try:
+                job = self._writes.get(timeout=0.25)
+            except queue.Empty:
+                if worker.is_cancelled:
+                    return
+                continue
+            if job is None:
+                return
+            write, done = job
+            result = write()
+            if done is not None and not worker.is_cancelled:
+                self.app.call_from_thread(done, result)
+
+    def on_unmount(self) -> None:
+        self._writes.put(None)
 
     def _selected_item_row(self) -> Optional[ItemRow]:
         if not self._item_rows:
@@ -463,23 +759,28 @@ class MainScreen(Screen):
         def _on_result(value: Optional[str]) -> None:
             if not value:
                 return
-            self.db.add_item(list_id, value)
-            self.refresh_items()
+            self._db_write(
+                lambda: self.db.add_item(list_id, value),
+                lambda _: self._items_changed(list_id),
+            )
 
         self.app.push_screen(InputScreen("New item"), _on_result)
 
     def action_edit_item(self) -> None:
-        if self._focus_panel != "items":
+        if self._focus_panel != "items" or not self._selected_list:
             return
         item = self._selected_item_row()
         if not item:
             return
+        list_id = self._selected_list.id
 
         def _on_result(value: Optional[str]) -> None:
             if not value:
                 return
-            self.db.update_item_text(item.id, value)
-            self.refresh_items()
+            self._db_write(
+                lambda: self.db.update_item_text(item.id, value),
+                lambda _: self._items_changed(list_id),
+            )
 
         self.app.push_screen(InputScreen("Edit item", item.text), _on_result)
 
@@ -494,8 +795,10 @@ class MainScreen(Screen):
         def _on_result(confirmed: bool) -> None:
             if not confirmed:
                 return
-            self.db.delete_item(list_id, item.id)
-            self.refresh_items()
+            self._db_write(
+                lambda: self.db.delete_item(list_id, item.id),
+                lambda _: self._items_changed(list_id),
+            )
 
         self.app.push_screen(ConfirmScreen("Delete this item?"), _on_result)
 
@@ -505,8 +808,11 @@ class MainScreen(Screen):
         item = self._selected_item_row()
         if not item:
             return
-        self.db.move_item(self._selected_list.id, item.id, -1)
-        self.refresh_items()
+        list_id = self._selected_list.id
+        self._db_write(
+            lambda: self.db.move_item(list_id, item.id, -1),
+            lambda _: self._item_moved(list_id, item.id),
+        )
 
     def action_move_down(self) -> None:
         if self._focus_panel != "items" or not self._selected_list:
@@ -514,8 +820,11 @@ class MainScreen(Screen):
         item = self._selected_item_row()
         if not item:
             return
-        self.db.move_item(self._selected_list.id, item.id, 1)
-        self.refresh_items()
+        list_id = self._selected_list.id
+        self._db_write(
+            lambda: self.db.move_item(list_id, item.id, 1),
+            lambda _: self._item_moved(list_id, item.id),
+        )
 
 
 class LystApp(App):